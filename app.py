@@ -670,6 +670,8 @@ class OllamaFlow(QMainWindow):
                         node.mark_dirty()
                         if hasattr(node, 'output_cache'):
                             node.output_cache = {}
+                        if hasattr(node, 'clear_memo'):
+                            node.clear_memo()
                         reset_count += 1
                 except Exception as e:
                     print(f"Error resetting node: {e}")
@@ -678,6 +680,23 @@ class OllamaFlow(QMainWindow):
         except Exception as e:
             print(f"Error in reset_workflow: {e}")
             self.statusBar.showMessage(f"Error resetting workflow: {str(e)}")
+    
+    def closeEvent(self, event):
+        """Stop running generations so their pool threads don't hold up exit"""
+        try:
+            all_nodes = []
+            if hasattr(self.graph, 'all_nodes') and callable(self.graph.all_nodes):
+                all_nodes = self.graph.all_nodes()
+            elif hasattr(self.graph, 'nodes') and callable(self.graph.nodes):
+                all_nodes = self.graph.nodes()
+            
+            for node in all_nodes:
+                if hasattr(node, 'stop_generation') and getattr(node, 'processing', False):
+                    node.stop_generation()
+        except Exception as e:
+            print(f"Error stopping generations on close: {e}")
+        
+        super().closeEvent(event)
 
 
 def ensure_directories():
@@ -3,6 +3,10 @@ import requests
 import json
 import time
 import copy
+import traceback
+from collections import OrderedDict
+from functools import lru_cache
+from hashlib import blake2b
 from threading import Thread
 from PySide6.QtCore import QObject, Signal, Qt, Slot, QThread, QCoreApplication, QTimer
 
@@ -18,13 +22,17 @@ class NodeSignalHandler(QObject):
         """Slot to update a node property on the main thread"""
         print(f"UI Update: Setting {prop_name} = {value[:30]}... on {node.name()}" if isinstance(value, str) else f"UI Update: Setting {prop_name} = {value} on {node.name()}")
         if hasattr(node, 'set_property'):
+            # Our nodes recorded this value when it was queued; tell them it's
+            # only being delivered now, so a late delivery doesn't overwrite
+            # a newer recorded value
+            extra = {'_queued': True} if hasattr(node, '_display_values') else {}
             try:
                 # Use the NodeGraphQt's property system
                 # The push_undo=False argument is important for compatibility
-                node.set_property(prop_name, value, push_undo=False)
+                node.set_property(prop_name, value, push_undo=False, **extra)
             except TypeError:
                 # Fall back to simpler version if push_undo isn't supported
-                node.set_property(prop_name, value)
+                node.set_property(prop_name, value, **extra)
                 
             # Force widget refresh after property update
             if hasattr(node, '_NodeObject__view'):
@@ -81,6 +89,20 @@ class NodeSignalHandler(QObject):
 # Create a singleton instance of the signal handler
 _signal_handler = None
 
+def _memo_token(value):
+    """
+    Turn an input value into a memo key component.
+    
+    Hashable values are kept as-is so lookups compare the values themselves
+    (hash() alone collides, e.g. hash(-1) == hash(-2)); unhashable ones are
+    replaced by a strong digest of their repr.
+    """
+    try:
+        hash(value)
+    except TypeError:
+        return type(value).__name__, blake2b(repr(value).encode(), digest_size=16).digest()
+    return type(value).__name__, value
+
 def get_signal_handler():
     """Get or create the signal handler singleton"""
     global _signal_handler
@@ -89,21 +111,25 @@ def get_signal_handler():
         
     if QCoreApplication.instance() is not None:
         print("Creating NodeSignalHandler for thread-safe UI updates")
-        _signal_handler = NodeSignalHandler()
+        handler = NodeSignalHandler()
         
-        # Connect the signals to slots
-        _signal_handler.property_updated.connect(
-            _signal_handler._update_property, 
+        # Connect the signals to slots. This only runs once, for the singleton,
+        # so each slot is connected exactly once.
+        handler.property_updated.connect(
+            handler._update_property, 
             Qt.QueuedConnection
         )
-        _signal_handler.status_updated.connect(
-            _signal_handler._update_status, 
+        handler.status_updated.connect(
+            handler._update_status, 
             Qt.QueuedConnection
         )
-        _signal_handler.widget_refresh.connect(
-            _signal_handler._refresh_node_widgets,
+        handler.widget_refresh.connect(
+            handler._refresh_node_widgets,
             Qt.QueuedConnection
         )
+        
+        # Only publish the handler once it's fully connected
+        _signal_handler = handler
     
     return _signal_handler
 
@@ -122,14 +148,46 @@ class OllamaBaseNode(BaseNode):
     # Node category for menu organization
     NODE_CATEGORY = 'Basic'
     
+    # Common properties that shouldn't get auto-inputs
+    _DEFAULT_EXCLUDES = frozenset({
+        'status_info', 'result_preview', 'response_preview', 'input_preview', 'recalculation_mode'
+    })
+    
+    # Display-only properties whose changes never mark the node dirty
+    _DIRTY_SKIP = frozenset({
+        'status_info', 'result_preview', 'response_preview', 'input_preview',
+        'output_preview', 'raw_response_preview'
+    })
+    
+    # Name suffixes of preview/status properties (excluded and never dirtying)
+    _DISPLAY_SUFFIXES = ('_preview', '_info', '_status')
+    
+    # Number of distinct input combinations whose outputs are remembered
+    _MEMO_SIZE = 8
+    
+    # Whether compute() may reuse a memoized output instead of calling execute().
+    # Nodes whose output isn't a pure function of their inputs turn this off.
+    _MEMOIZE = True
+    
+    # The application's main (GUI) thread, looked up once by _get_app_thread
+    _APP_THREAD = None
+    
+    # Maximum number of characters shown in preview properties
+    PREVIEW_LIMIT = 5000
+    
     def __init__(self):
-        super(OllamaBaseNode, self).__init__()
-        
-        # IMPORTANT: Initialize these FIRST to avoid errors in subclasses
+        # IMPORTANT: Initialize these FIRST, before BaseNode sets anything up,
+        # so every method can rely on them without defensive checks
         self._property_inputs = {}  # Maps property names to input port names
         self._input_properties = {}  # Maps input port names to property names
         self._excluded_input_props = set()  # Properties that shouldn't get auto-inputs
         self._property_values = {}  # Cache of property values to detect changes
+        self._input_port_cache = {}  # Maps input port names to port objects
+        self._prop_input_tuple = None  # Sorted (property, input) pairs, built lazily
+        self._plain_input_tuple = None  # Sorted input ports without a property
+        self._display_values = {}  # Latest value written to each preview property, queued or not
+        
+        super(OllamaBaseNode, self).__init__()
         
         # Processing state
         self.processing = False
@@ -140,9 +198,17 @@ class OllamaBaseNode(BaseNode):
         self.is_async_node = False  # Flag for async processing nodes
         self.processing_done = True  # Flag for tracking completion
         self.processing_start_time = 0  # When processing started
+        self._visited_dependencies = set()  # Guards against dependency cycles
+        self._from_workflow_executor = False  # Set while the executor drives compute()
+        
+        # Outputs of previous runs keyed by a hash of their input values
+        self._memo = OrderedDict()
+        self._pending_memo_key = None  # Key for the async run in progress
         
         # Add recalculation mode property - this is a node configuration option
-        # Renamed for clarity on behavior
+        # Renamed for clarity on behavior. The current mode is mirrored in
+        # _recalc_mode so property-change checks don't resolve it every time.
+        self._recalc_mode = 'Dirty if inputs change'
         self.exclude_property_from_input('recalculation_mode')
         self.add_combo_menu('recalculation_mode', 'Recalculation Mode', 
                            ['Dirty if inputs change', 'Always dirty', 'Never dirty'], 
@@ -156,35 +222,70 @@ class OllamaBaseNode(BaseNode):
         Mark a property as excluded from auto-input creation.
         Use this before creating the property.
         """
-        # Defensive initialization - ensure the set exists
-        if not hasattr(self, '_excluded_input_props'):
-            self._excluded_input_props = set()
-            
         self._excluded_input_props.add(prop_name)
         
     def mark_dirty(self):
-        """Mark this node as needing reprocessing"""
+        """Mark this node and the nodes downstream of it as needing reprocessing"""
+        nodes, other_nodes = self._collect_dirty_downstream()
+        
+        # Flip the flags in a single pass once the affected set is known
+        for node in nodes:
+            node.dirty = True
+            node.status = "Ready"
+        
+        # Nodes from other base classes handle their own propagation
+        for node in other_nodes:
+            node.mark_dirty()
+    
+    def _collect_dirty_downstream(self):
+        """
+        Collect the nodes that mark_dirty should flag, starting with this one.
+        
+        Walks downstream iteratively, visiting each node at most once, so graphs
+        where several paths re-converge don't revisit shared nodes. Propagation
+        stops at nodes that are already dirty or whose mode keeps their cache.
+        
+        Returns:
+            Tuple of (OllamaBaseNodes to flag, other nodes that have a mark_dirty)
+        """
+        nodes = []
+        other_nodes = []
+        seen = {self}
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            
+            # Only proceed if not already dirty and the mode allows it
+            if node.dirty or node._ignores_mark_dirty():
+                continue
+            nodes.append(node)
+            
+            # Queue downstream nodes
+            for port in node.output_ports():
+                for connected_port in port.connected_ports():
+                    connected_node = connected_port.node()
+                    if connected_node in seen:
+                        continue
+                    seen.add(connected_node)
+                    if isinstance(connected_node, OllamaBaseNode):
+                        stack.append(connected_node)
+                    elif hasattr(connected_node, 'mark_dirty'):
+                        other_nodes.append(connected_node)
+                        
+        return nodes, other_nodes
+    
+    def _ignores_mark_dirty(self):
+        """Check if 'Never dirty' mode should keep this node's cached output"""
         # Don't mark as dirty if recalculation mode is "Never dirty" and we have output_cache
         try:
             recalc_mode = self.get_property('recalculation_mode')
             if recalc_mode == 'Never dirty' and hasattr(self, 'output_cache') and self.output_cache:
                 print(f"Node {self.name()}: Not marking as dirty due to 'Never dirty' mode")
-                return
+                return True
         except Exception as e:
             # If we can't get the mode, proceed with normal marking
             print(f"Node {self.name()}: Error checking recalculation mode: {e}, proceeding with normal marking")
-
-        # Only proceed if not already dirty
-        if not self.dirty:
-            self.dirty = True
-            self.status = "Ready"
-            
-            # Mark downstream nodes as dirty
-            for port in self.output_ports():
-                for connected_port in port.connected_ports():
-                    connected_node = connected_port.node()
-                    if hasattr(connected_node, 'mark_dirty'):
-                        connected_node.mark_dirty()
+        return False
     
     def _mark_downstream_dirty(self):
         """Mark downstream nodes as dirty if appropriate"""
@@ -229,6 +330,9 @@ class OllamaBaseNode(BaseNode):
             self.output_cache = node_dict['ollama_output_cache']
             print(f"Node {self.name()}: Restored output cache with {len(self.output_cache)} entries")
         
+        # Properties may have been restored without going through set_property
+        self._recalc_mode = BaseNode.get_property(self, 'recalculation_mode')
+        
         # Restore processing state flags
         if 'ollama_dirty' in node_dict:
             self.dirty = node_dict['ollama_dirty']
@@ -264,24 +368,19 @@ class OllamaBaseNode(BaseNode):
             Process this node (should be called when inputs change).
             Enhanced with improved dependency handling and output change detection.
             """
-            # Update status
-            self.status = "Processing..."
-            self.set_property('status_info', "Processing...")
             node_name = self.name() if hasattr(self, 'name') and callable(getattr(self, 'name')) else "Unknown"
-            print(f"Node {node_name}: Status set to Processing...")
-            
-            # Get the current recalculation mode
-            recalculation_mode = self.get_property('recalculation_mode')
             
             # If already processing, just return cached output to prevent cycles
             if self.processing:
                 print(f"Node {node_name}: Already processing, returning cached output to avoid cycle")
                 return self.output_cache or {}
             
+            # Get the current recalculation mode
+            recalculation_mode = self.get_property('recalculation_mode')
+            
             # Handle caching based on recalculation mode
             if recalculation_mode == 'Never dirty' and hasattr(self, 'output_cache') and self.output_cache:
-                self.status = "Complete (cached)"
-                self.set_property('status_info', "Complete (cached)")
+                self._set_compute_status("Complete (cached)")
                 print(f"Node {node_name}: Using cached output (Never dirty mode)")
                 return self.output_cache
                 
@@ -290,17 +389,20 @@ class OllamaBaseNode(BaseNode):
                 # Always recalculate for this mode, even if not dirty
                 print(f"Node {node_name}: Always dirty mode - forcing recalculation")
             elif not self.dirty and hasattr(self, 'output_cache') and self.output_cache:
-                self.status = "Complete (cached)"
-                self.set_property('status_info', "Complete (cached)")
+                self._set_compute_status("Complete (cached)")
                 print(f"Node {node_name}: Using cached output (not dirty)")
                 return self.output_cache
             
+            # Update status now that we know there's work to do
+            self._set_compute_status("Processing...")
+            print(f"Node {node_name}: Status set to Processing...")
+            
             # Process all input dependencies first
             # This ensures all inputs are up-to-date before we execute
             try:
                 # Check if we're being called from the workflow executor
                 # If so, skip dependency processing as the executor should handle dependencies
-                from_executor = getattr(self, '_from_workflow_executor', False)
+                from_executor = self._from_workflow_executor
                 
                 if not from_executor:
                     # If we're not being called from the workflow executor, process dependencies
@@ -309,19 +411,47 @@ class OllamaBaseNode(BaseNode):
                 else:
                     print(f"Node {node_name}: Skipping dependency processing (called from workflow executor)")
             except Exception as e:
-                import traceback
                 traceback.print_exc()
                 self.processing_error = str(e)
-                error_msg = f"Error in dependencies: {str(e)[:30]}..."
-                self.status = error_msg
-                self.set_property('status_info', error_msg)
+                error_msg = f"Error in dependencies: {self.processing_error[:30]}..."
+                self._set_compute_status(error_msg)
                 return {}
             
+            # Reuse a memoized result if the inputs match a previous run, even
+            # when an upstream change marked us dirty without changing values
+            memo_key = None
+            if self._MEMOIZE and recalculation_mode != 'Always dirty':
+                try:
+                    memo_key = self._memo_key()
+                except Exception as e:
+                    # Let execute() surface input errors as usual
+                    print(f"Node {node_name}: Could not build memo key: {e}")
+                    
+                memo_hit = self._memo.get(memo_key) if memo_key is not None else None
+                if memo_hit is not None:
+                    self._memo.move_to_end(memo_key)
+                    memo_result, memo_display = memo_hit
+                    output_changed = self._has_output_changed(memo_result)
+                    self.output_cache = copy.deepcopy(memo_result)
+                    
+                    # Bring the previews back in line with the reused output, since
+                    # they're what gets shown and saved with the workflow
+                    for prop_name, value in memo_display.items():
+                        self.set_property(prop_name, value)
+                    
+                    self.dirty = False
+                    if output_changed and recalculation_mode != 'Never dirty':
+                        self._mark_downstream_dirty()
+                    self._set_compute_status("Complete (memoized)")
+                    print(f"Node {node_name}: Inputs unchanged, using memoized output")
+                    return self.output_cache
+            
             # Set processing state
             self.processing = True
             self.processing_done = False
             self.processing_error = None
             self.processing_start_time = time.time()
+            self._pending_memo_key = memo_key
             
             try:
                 # Execute the actual node-specific processing logic
@@ -334,8 +464,8 @@ class OllamaBaseNode(BaseNode):
                     
                     # Update the cache - use deep copy to avoid reference issues
                     if result:
-                        import copy
                         self.output_cache = copy.deepcopy(result)
+                        self._remember_output(memo_key, result)
                     
                     # Clear dirty flag
                     self.dirty = False
@@ -344,8 +474,7 @@ class OllamaBaseNode(BaseNode):
                     if output_changed and recalculation_mode != 'Never dirty':
                         self._mark_downstream_dirty()
                     
-                    self.status = "Complete"
-                    self.set_property('status_info', "Complete")
+                    self._set_compute_status("Complete")
                     print(f"Node {node_name}: Execution complete, status set to Complete")
                     self.processing_done = True
                     self.processing = False
@@ -357,26 +486,27 @@ class OllamaBaseNode(BaseNode):
                 return result or {}
                 
             except Exception as e:
-                import traceback
                 traceback.print_exc()
                 self.processing_error = str(e)
-                error_msg = f"Error: {str(e)[:30]}..."
-                self.status = error_msg
-                self.set_property('status_info', error_msg)
+                error_msg = f"Error: {self.processing_error[:30]}..."
+                self._set_compute_status(error_msg)
                 print(f"Node {node_name}: Execution error: {error_msg}")
                 self.processing_done = True
                 self.processing = False
                 
                 return {}
         
+    def _set_compute_status(self, status_text):
+        """Set status and status_info, skipping the writes if nothing changed"""
+        if self.status == status_text:
+            return
+        self.status = status_text
+        self.set_property('status_info', status_text)
+        
     def _process_input_dependencies(self):
         """
         Processes all input dependencies to ensure they're computed before this node.
         """
-        # Keep track of visited nodes to prevent cycles
-        if not hasattr(self, '_visited_dependencies'):
-            self._visited_dependencies = set()
-        
         # If this node is already in the visited set, we have a cycle
         node_name = self.name() if hasattr(self, 'name') and callable(getattr(self, 'name')) else "Unknown"
         if self in self._visited_dependencies:
@@ -481,8 +611,9 @@ class OllamaBaseNode(BaseNode):
             output_changed = self._has_output_changed(result_dict)
             
             # Update the cache with a deep copy to avoid reference issues
-            import copy
             self.output_cache = copy.deepcopy(result_dict)
+            if not self.processing_error:
+                self._remember_output(self._pending_memo_key, result_dict)
             
             # If output changed and not in Never dirty mode, mark downstream nodes dirty
             recalculation_mode = self.get_property('recalculation_mode')
@@ -493,15 +624,68 @@ class OllamaBaseNode(BaseNode):
             print(f"Node {node_name}: Updated output cache with {len(result_dict)} entries")
         
         # Clear dirty flag - async processing is now complete
+        self._pending_memo_key = None
         self.dirty = False
         self.processing = False
         self.processing_done = True
         
         # Make sure status is updated
         if not self.processing_error:
-            self.status = "Complete"
-            self.set_property('status_info', "Complete")
+            self._set_compute_status("Complete")
 
+    def _memo_key(self):
+        """
+        Build a memo key from the current value of every input-backed
+        property and every plain input port.
+        """
+        # Freeze the sorted input lists once; they only change while ports are added
+        if self._prop_input_tuple is None:
+            self._prop_input_tuple = tuple(sorted(self._property_inputs.items()))
+        if self._plain_input_tuple is None:
+            self._plain_input_tuple = tuple(sorted(
+                name for name in self._input_port_cache if name not in self._input_properties))
+            
+        key = [(prop_name, _memo_token(self.get_property_value(prop_name)))
+               for prop_name, _ in self._prop_input_tuple]
+        key.extend((input_name, _memo_token(self.get_input_data(input_name)))
+                   for input_name in self._plain_input_tuple)
+        return tuple(key)
+    
+    def _remember_output(self, memo_key, result):
+        """
+        Store a result under its memo key, evicting the least recently used.
+        
+        The node's preview properties are stored along with it, so a memo
+        hit can restore them without running execute().
+        """
+        # Empty results are cheap to recompute and may come from a failed run
+        if memo_key is None or not result or not any(result.values()):
+            return
+        self._memo[memo_key] = (copy.deepcopy(result), self._snapshot_display())
+        self._memo.move_to_end(memo_key)
+        while len(self._memo) > self._MEMO_SIZE:
+            self._memo.popitem(last=False)
+    
+    def _is_display_prop(self, prop_name):
+        """Whether a property is a preview restored on a memo hit (the status is set separately)"""
+        return prop_name != 'status_info' and (
+            prop_name in self._DIRTY_SKIP or prop_name.endswith(self._DISPLAY_SUFFIXES))
+    
+    def _snapshot_display(self):
+        """
+        Return the preview values the node last wrote.
+        
+        These are recorded when set_property is called rather than read back
+        from the properties, since writes made off the main thread are still
+        queued when execute() returns.
+        """
+        return dict(self._display_values)
+    
+    def clear_memo(self):
+        """Forget memoized outputs so the next compute runs execute() again"""
+        self._memo.clear()
+        self._pending_memo_key = None
+    
     def _has_output_changed(self, new_output):
         """Check if the output has changed compared to the cached output"""
         if not hasattr(self, 'output_cache') or not self.output_cache:
@@ -527,29 +711,45 @@ class OllamaBaseNode(BaseNode):
                     
         return False  # No changes detected
 
+    def add_input(self, name='input', *args, **kwargs):
+        """Add an input port and remember it for name lookups in get_input_data"""
+        port = super(OllamaBaseNode, self).add_input(name, *args, **kwargs)
+        self._input_port_cache[name] = port
+        self._plain_input_tuple = None
+        return port
+    
     def get_input_data(self, input_name):
         """Get data from an input port by name"""
         # Get the input port
-        input_port = None
-        for port in self.input_ports():
-            if port.name() == input_name:
-                input_port = port
-                break
+        input_port = self._input_port_cache.get(input_name)
+        if input_port is None:
+            # Port wasn't created through add_input - fall back to a scan
+            for port in self.input_ports():
+                if port.name() == input_name:
+                    input_port = port
+                    self._input_port_cache[input_name] = port
+                    break
                 
-        if not input_port or not input_port.connected_ports():
+        if not input_port:
+            return None
+        connected_ports = input_port.connected_ports()
+        if not connected_ports:
             return None
         
         # Get the first connected port
-        connected_port = input_port.connected_ports()[0]
+        connected_port = connected_ports[0]
         connected_node = connected_port.node()
         connected_node_name = connected_node.name() if hasattr(connected_node, 'name') and callable(getattr(connected_node, 'name')) else "Unknown"
         
         # Check if we're being called from the workflow executor
-        from_executor = getattr(self, '_from_workflow_executor', False)
+        from_executor = self._from_workflow_executor
         
         # Only process the connected node if it's dirty AND we're not in workflow executor mode
-        # This prevents cascading computations outside the workflow executor's control
-        if not from_executor and hasattr(connected_node, 'dirty') and connected_node.dirty:
+        # This prevents cascading computations outside the workflow executor's control.
+        # A node that's already processing would just return early, so skip the call
+        # and fall through to waiting on it below.
+        if (not from_executor and getattr(connected_node, 'dirty', False)
+                and not getattr(connected_node, 'processing', False)):
             print(f"Node {self.name()}: Processing dependency {connected_node_name}")
             connected_node.compute()
         
@@ -597,11 +797,12 @@ class OllamaBaseNode(BaseNode):
         
         # Get data from the connected port's node
         if hasattr(connected_node, 'output_cache'):
-            value = connected_node.output_cache.get(connected_port.name(), None)
+            port_name = connected_port.name()
+            value = connected_node.output_cache.get(port_name, None)
             if value is not None:
-                print(f"Node {self.name()}: Got value from {connected_node_name} port {connected_port.name()}")
+                print(f"Node {self.name()}: Got value from {connected_node_name} port {port_name}")
             else:
-                print(f"Node {self.name()}: No value from {connected_node_name} port {connected_port.name()}")
+                print(f"Node {self.name()}: No value from {connected_node_name} port {port_name}")
             return value
         
         return None
@@ -650,15 +851,19 @@ class OllamaBaseNode(BaseNode):
                     # Use super's set_property to avoid recursion
                     super(OllamaBaseNode, self).set_property('status_info', status_text)
     
+    @classmethod
+    def _get_app_thread(cls):
+        """Get the main (GUI) thread, caching it once the application exists"""
+        if cls._APP_THREAD is None:
+            app = QCoreApplication.instance()
+            if app is not None:
+                OllamaBaseNode._APP_THREAD = app.thread()
+        return cls._APP_THREAD
+    
     def set_status(self, status_text):
         """Set the status text for the node"""
         # If called from a non-main thread, use the thread-safe version
-        current_thread = QThread.currentThread()
-        app_thread = None
-        if QCoreApplication.instance():
-            app_thread = QCoreApplication.instance().thread()
-            
-        if current_thread != app_thread:
+        if QThread.currentThread() is not self._get_app_thread():
             self.thread_safe_set_status(status_text)
             return
             
@@ -669,55 +874,72 @@ class OllamaBaseNode(BaseNode):
             if self.get_property('status_info') is not None:
                 self.set_property('status_info', status_text)
 
+    def make_preview(self, text, limit=None):
+        """
+        Build a bounded preview string for display properties.
+        
+        Short text is returned as-is without copying; long text is cut to
+        the limit with a trailing ellipsis.
+        
+        Args:
+            text: The full text to preview
+            limit: Maximum characters to keep (defaults to PREVIEW_LIMIT)
+        """
+        if limit is None:
+            limit = self.PREVIEW_LIMIT
+        if len(text) <= limit:
+            return text
+        return text[:limit] + '...'
+
     # ----- Enhanced property methods -----
     
-    def add_text_input(self, prop_name, label, default_value="", tab=None):
+    def _register_prop(self, add_method, prop_name, default, tab, *args):
         """
-        Add a text input property with an optional corresponding input port.
+        Shared implementation of the add_* property methods.
         
         Args:
+            add_method: The BaseNode add_* method that creates the widget
             prop_name: Name of the property
-            label: Display label for the property
-            default_value: Default value for the property
+            default: Initial value, stored for change detection
             tab: Optional tab name to place the property in
+            *args: Remaining positional arguments for add_method
         """
-        # Ensure the excluded properties set exists
-        if not hasattr(self, '_excluded_input_props'):
-            self._excluded_input_props = set()
-            
-        # Ensure the property inputs map exists
-        if not hasattr(self, '_property_inputs'):
-            self._property_inputs = {}
-            
-        # Ensure the input properties map exists
-        if not hasattr(self, '_input_properties'):
-            self._input_properties = {}
-            
         # Call the original method from BaseNode
         kwargs = {}
         if tab is not None:
             kwargs['tab'] = tab
             
-        result = super(OllamaBaseNode, self).add_text_input(prop_name, label, default_value, **kwargs)
+        result = add_method(prop_name, *args, **kwargs)
         
         # Store the initial property value for change detection
-        if not hasattr(self, '_property_values'):
-            self._property_values = {}
-        self._property_values[prop_name] = default_value
+        self._property_values[prop_name] = default
         
         # Create the corresponding input port if not excluded
-        should_create_input = not self._should_exclude_property(prop_name)
-        
-        if should_create_input:
+        if not self._should_exclude_property(prop_name):
             input_name = self._get_input_name_for_property(prop_name)
             self.add_input(input_name)
             
             # Track the property-input relationship
             self._property_inputs[prop_name] = input_name
             self._input_properties[input_name] = prop_name
+            self._prop_input_tuple = None
+            self._plain_input_tuple = None
             
         return result
     
+    def add_text_input(self, prop_name, label, default_value="", tab=None):
+        """
+        Add a text input property with an optional corresponding input port.
+        
+        Args:
+            prop_name: Name of the property
+            label: Display label for the property
+            default_value: Default value for the property
+            tab: Optional tab name to place the property in
+        """
+        return self._register_prop(super(OllamaBaseNode, self).add_text_input,
+                                   prop_name, default_value, tab, label, default_value)
+    
     def add_combo_menu(self, prop_name, label, items, default="", tab=None):
         """
         Add a combo menu property with an optional corresponding input port.
@@ -729,42 +951,8 @@ class OllamaBaseNode(BaseNode):
             default: Default selected item
             tab: Optional tab name to place the property in
         """
-        # Ensure the excluded properties set exists
-        if not hasattr(self, '_excluded_input_props'):
-            self._excluded_input_props = set()
-            
-        # Ensure the property inputs map exists
-        if not hasattr(self, '_property_inputs'):
-            self._property_inputs = {}
-            
-        # Ensure the input properties map exists
-        if not hasattr(self, '_input_properties'):
-            self._input_properties = {}
-            
-        # Call the original method from BaseNode
-        kwargs = {}
-        if tab is not None:
-            kwargs['tab'] = tab
-            
-        result = super(OllamaBaseNode, self).add_combo_menu(prop_name, label, items, default, **kwargs)
-        
-        # Store the initial property value for change detection
-        if not hasattr(self, '_property_values'):
-            self._property_values = {}
-        self._property_values[prop_name] = default
-        
-        # Create the corresponding input port if not excluded
-        should_create_input = not self._should_exclude_property(prop_name)
-        
-        if should_create_input:
-            input_name = self._get_input_name_for_property(prop_name)
-            self.add_input(input_name)
-            
-            # Track the property-input relationship
-            self._property_inputs[prop_name] = input_name
-            self._input_properties[input_name] = prop_name
-            
-        return result
+        return self._register_prop(super(OllamaBaseNode, self).add_combo_menu,
+                                   prop_name, default, tab, label, items, default)
     
     def add_checkbox(self, prop_name, label, default=False, tab=None):
         """
@@ -776,42 +964,8 @@ class OllamaBaseNode(BaseNode):
             default: Default state (True/False)
             tab: Optional tab name to place the property in
         """
-        # Ensure the excluded properties set exists
-        if not hasattr(self, '_excluded_input_props'):
-            self._excluded_input_props = set()
-            
-        # Ensure the property inputs map exists
-        if not hasattr(self, '_property_inputs'):
-            self._property_inputs = {}
-            
-        # Ensure the input properties map exists
-        if not hasattr(self, '_input_properties'):
-            self._input_properties = {}
-            
-        # Call the original method from BaseNode
-        kwargs = {}
-        if tab is not None:
-            kwargs['tab'] = tab
-            
-        result = super(OllamaBaseNode, self).add_checkbox(prop_name, label, default, **kwargs)
-        
-        # Store the initial property value for change detection
-        if not hasattr(self, '_property_values'):
-            self._property_values = {}
-        self._property_values[prop_name] = default
-        
-        # Create the corresponding input port if not excluded
-        should_create_input = not self._should_exclude_property(prop_name)
-        
-        if should_create_input:
-            input_name = self._get_input_name_for_property(prop_name)
-            self.add_input(input_name)
-            
-            # Track the property-input relationship
-            self._property_inputs[prop_name] = input_name
-            self._input_properties[input_name] = prop_name
-            
-        return result
+        return self._register_prop(super(OllamaBaseNode, self).add_checkbox,
+                                   prop_name, default, tab, label, default)
     
     def add_float_input(self, prop_name, label, default=0.0, tab=None):
         """
@@ -823,42 +977,8 @@ class OllamaBaseNode(BaseNode):
             default: Default value
             tab: Optional tab name to place the property in
         """
-        # Ensure the excluded properties set exists
-        if not hasattr(self, '_excluded_input_props'):
-            self._excluded_input_props = set()
-            
-        # Ensure the property inputs map exists
-        if not hasattr(self, '_property_inputs'):
-            self._property_inputs = {}
-            
-        # Ensure the input properties map exists
-        if not hasattr(self, '_input_properties'):
-            self._input_properties = {}
-            
-        # Call the original method from BaseNode
-        kwargs = {}
-        if tab is not None:
-            kwargs['tab'] = tab
-            
-        result = super(OllamaBaseNode, self).add_float_input(prop_name, label, default, **kwargs)
-        
-        # Store the initial property value for change detection
-        if not hasattr(self, '_property_values'):
-            self._property_values = {}
-        self._property_values[prop_name] = default
-        
-        # Create the corresponding input port if not excluded
-        should_create_input = not self._should_exclude_property(prop_name)
-        
-        if should_create_input:
-            input_name = self._get_input_name_for_property(prop_name)
-            self.add_input(input_name)
-            
-            # Track the property-input relationship
-            self._property_inputs[prop_name] = input_name
-            self._input_properties[input_name] = prop_name
-            
-        return result
+        return self._register_prop(super(OllamaBaseNode, self).add_float_input,
+                                   prop_name, default, tab, label, default)
     
     def add_int_input(self, prop_name, label, default=0, tab=None):
         """
@@ -870,42 +990,8 @@ class OllamaBaseNode(BaseNode):
             default: Default value
             tab: Optional tab name to place the property in
         """
-        # Ensure the excluded properties set exists
-        if not hasattr(self, '_excluded_input_props'):
-            self._excluded_input_props = set()
-            
-        # Ensure the property inputs map exists
-        if not hasattr(self, '_property_inputs'):
-            self._property_inputs = {}
-            
-        # Ensure the input properties map exists
-        if not hasattr(self, '_input_properties'):
-            self._input_properties = {}
-            
-        # Call the original method from BaseNode
-        kwargs = {}
-        if tab is not None:
-            kwargs['tab'] = tab
-            
-        result = super(OllamaBaseNode, self).add_int_input(prop_name, label, default, **kwargs)
-        
-        # Store the initial property value for change detection
-        if not hasattr(self, '_property_values'):
-            self._property_values = {}
-        self._property_values[prop_name] = default
-        
-        # Create the corresponding input port if not excluded
-        should_create_input = not self._should_exclude_property(prop_name)
-        
-        if should_create_input:
-            input_name = self._get_input_name_for_property(prop_name)
-            self.add_input(input_name)
-            
-            # Track the property-input relationship
-            self._property_inputs[prop_name] = input_name
-            self._input_properties[input_name] = prop_name
-            
-        return result
+        return self._register_prop(super(OllamaBaseNode, self).add_int_input,
+                                   prop_name, default, tab, label, default)
     
     def get_property_value(self, prop_name):
         """
@@ -920,8 +1006,8 @@ class OllamaBaseNode(BaseNode):
             The value from the input connection or the property value
         """
         # Check if this property has a corresponding input
-        if hasattr(self, '_property_inputs') and prop_name in self._property_inputs:
-            input_name = self._property_inputs[prop_name]
+        input_name = self._property_inputs.get(prop_name)
+        if input_name is not None:
             input_value = self.get_input_data(input_name)
             
             # If the input is connected and has a value, use it
@@ -929,30 +1015,34 @@ class OllamaBaseNode(BaseNode):
                 return input_value
         
         # Otherwise use the property value
-        return super(OllamaBaseNode, self).get_property(prop_name)
+        return BaseNode.get_property(self, prop_name)
     
-    def _get_input_name_for_property(self, prop_name):
-        """Generate an input port name for a property"""
+    def _snapshot(self, prop_names):
+        """
+        Read several property values (inputs first) into a dict in one go.
+        
+        Args:
+            prop_names: Iterable of property names to read
+            
+        Returns:
+            Dict mapping each property name to its current value
+        """
+        return {prop_name: self.get_property_value(prop_name) for prop_name in prop_names}
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _get_input_name_for_property(prop_name):
+        """Generate an input port name for a property (pure, so results are cached)"""
         # Convert to title case and add spaces for readability
-        input_name = ' '.join(word.capitalize() for word in prop_name.split('_'))
-        return f"{input_name}"
+        return ' '.join(word.capitalize() for word in prop_name.split('_'))
     
     def _should_exclude_property(self, prop_name):
         """Check if a property should be excluded from auto-input creation"""
-        # Ensure the excluded properties set exists
-        if not hasattr(self, '_excluded_input_props'):
-            self._excluded_input_props = set()
-        
-        # Common properties that shouldn't get inputs
-        default_excludes = {
-            'status_info', 'result_preview', 'response_preview', 'input_preview', 'recalculation_mode'
-        }
-        
-        if prop_name in default_excludes or prop_name in self._excluded_input_props:
+        if prop_name in self._DEFAULT_EXCLUDES or prop_name in self._excluded_input_props:
             return True
             
         # Skip properties that end with common preview/status suffixes
-        if prop_name.endswith(('_preview', '_info', '_status')):
+        if prop_name.endswith(self._DISPLAY_SUFFIXES):
             return True
             
         return False
@@ -973,28 +1063,27 @@ class OllamaBaseNode(BaseNode):
             value: Value to set the property to
             **kwargs: Additional keyword arguments (like push_undo)
         """
+        # Record preview values as they're written, even if the write is queued
+        # for the main thread; deliveries of queued writes were recorded already
+        queued = kwargs.pop('_queued', False)
+        if not queued and self._is_display_prop(name):
+            self._display_values[name] = value
+        
         # If called from a non-main thread, use the thread-safe version
-        current_thread = QThread.currentThread()
-        app_thread = None
-        if QCoreApplication.instance():
-            app_thread = QCoreApplication.instance().thread()
-            
-        if current_thread != app_thread:
+        if QThread.currentThread() is not self._get_app_thread():
             self.thread_safe_set_property(name, value)
             return
 
         # Get old value for change detection
-        old_value = None
-        if hasattr(self, '_property_values'):
-            old_value = self._property_values.get(name)
+        old_value = self._property_values.get(name)
         
         # Call the original method
         result = super(OllamaBaseNode, self).set_property(name, value, **kwargs)
         
         # Store the new value
-        if not hasattr(self, '_property_values'):
-            self._property_values = {}
         self._property_values[name] = value
+        if name == 'recalculation_mode':
+            self._recalc_mode = value
         
         # Check if this property change should mark the node as dirty
         if self._should_mark_dirty_on_property_change(name, old_value, value):
@@ -1016,7 +1105,7 @@ class OllamaBaseNode(BaseNode):
             True if the node should be marked as dirty, False otherwise
         """
         # Get recalculation mode
-        recalc_mode = self.get_property('recalculation_mode')
+        recalc_mode = self._recalc_mode
         
         # Always dirty mode: property changes don't need to mark it dirty
         if recalc_mode == 'Always dirty':
@@ -1027,9 +1116,8 @@ class OllamaBaseNode(BaseNode):
             return False
             
         # Don't mark dirty for these property types
-        if prop_name in {'status_info', 'result_preview', 'response_preview', 'input_preview', 
-                        'output_preview', 'raw_response_preview'} or \
-           prop_name.endswith(('_preview', '_info', '_status')):
+        if prop_name in self._DIRTY_SKIP or \
+           prop_name.endswith(self._DISPLAY_SUFFIXES):
             return False
             
         # Don't mark dirty if recalculation mode is being changed
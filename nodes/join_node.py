@@ -13,6 +13,9 @@ class JoinNode(OllamaBaseNode):
     # Node category for menu organization
     NODE_CATEGORY = 'Basic'
     
+    # (input port name, property name) for each numbered input, in join order
+    _INPUT_KEYS = tuple((f'Input {i+1}', f'input_{i+1}') for i in range(8))
+    
     def __init__(self):
         super(JoinNode, self).__init__()
         
@@ -20,8 +23,8 @@ class JoinNode(OllamaBaseNode):
         self.set_name('Join')
         
         # Create numbered input properties - these will automatically create input ports
-        for i in range(8):
-            self.add_text_input(f'input_{i+1}', f'Input {i+1}', '')
+        for input_port_name, prop_name in self._INPUT_KEYS:
+            self.add_text_input(prop_name, input_port_name, '')
         
         # Create configuration properties - these will automatically create input ports
         self.add_text_input('delimiter', 'Delimiter', '\n')
@@ -49,29 +52,43 @@ class JoinNode(OllamaBaseNode):
         # Set initial status
         self.set_status("Processing inputs...")
         
+        # Read the configuration once rather than on every input
+        trim_whitespace = str(self.get_property('trim_whitespace')).lower() == 'true'
+        skip_empty = str(self.get_property('skip_empty')).lower() == 'true'
+        delimiter = self.get_property('delimiter')
+        
+        # Look up which inputs are wired once; unwired ones go straight to their property
+        connected_inputs = {name for name, port in self._input_port_cache.items()
+                            if port.connected_ports()}
+        
+        # Nothing wired and nothing typed in: skip the join and preview work
+        if (not any(port_name in connected_inputs for port_name, _ in self._INPUT_KEYS)
+                and not any(self.get_property(prop_name) for _, prop_name in self._INPUT_KEYS)):
+            self.set_status("All inputs empty")
+            self.set_property('result_preview', '')
+            return {"Result": ""}
+        
         # Process inputs in order
-        for i in range(8):
-            input_num = i + 1
-            input_port_name = f'Input {input_num}'
-            prop_name = f'input_{input_num}'
-            
+        for input_port_name, prop_name in self._INPUT_KEYS:
             # Track if we've found a value for this input
             value_found = False
             
             # Use the proper base node method to get input data
             # This method handles waiting for async nodes properly
-            input_value = self.get_input_data(input_port_name)
+            input_value = None
+            if input_port_name in connected_inputs:
+                input_value = self.get_input_data(input_port_name)
             
             # If we got a value from the connection
             if input_value is not None:
                 value_str = str(input_value)
                 
                 # Apply trimming if enabled
-                if self.get_property('trim_whitespace').lower() == 'true':
+                if trim_whitespace:
                     value_str = value_str.strip()
                 
                 # Add to values if not skipping empty or if not empty
-                if not self.get_property('skip_empty').lower() == 'true' or value_str:
+                if not skip_empty or value_str:
                     values.append(value_str)
                     value_found = True
             # If no value from connection, check the property value
@@ -84,11 +101,11 @@ class JoinNode(OllamaBaseNode):
                     value_str = str(prop_value)
                     
                     # Apply trimming if enabled
-                    if self.get_property('trim_whitespace').lower() == 'true':
+                    if trim_whitespace:
                         value_str = value_str.strip()
                     
                     # Add to values if not skipping empty or if not empty
-                    if not self.get_property('skip_empty').lower() == 'true' or value_str:
+                    if not skip_empty or value_str:
                         values.append(value_str)
                         value_found = True
             
@@ -97,17 +114,15 @@ class JoinNode(OllamaBaseNode):
                 empty_count += 1
         
         # Join the values with the delimiter
-        delimiter = self.get_property('delimiter')
         result = delimiter.join(values)
         
         # Update status based on inputs
-        if empty_count == 8:
+        if empty_count == len(self._INPUT_KEYS):
             self.set_status("All inputs empty")
         else:
             self.set_status(f"Complete: {len(values)} inputs joined")
         
         # Update preview
-        preview = result[:5000] + ('...' if len(result) > 5000 else '')
-        self.set_property('result_preview', preview)
+        self.set_property('result_preview', self.make_preview(result))
         
         return {"Result": result}
@@ -1,11 +1,258 @@
 from nodes.base_node import OllamaBaseNode
 import requests
+from requests.adapters import HTTPAdapter
 import json
+import os
 import re
+import socket
+import sys
 import time
-from threading import Thread
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from hashlib import blake2b
+from threading import Event, Lock
 from PySide6.QtCore import QObject, Signal, Slot, Qt, QCoreApplication, QThread
 
+# Verbose progress logging, enabled by setting OLLAMAFLOW_DEBUG
+_DEBUG = bool(os.environ.get('OLLAMAFLOW_DEBUG'))
+
+# Streamed lines are decoded (and request bodies encoded) with orjson when
+# it's installed (much faster per token); the standard library is used otherwise
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj):
+        """Encode obj as UTF-8 JSON bytes, like orjson.dumps"""
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+# Headers for request bodies that are already encoded as JSON
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# One HTTP session for all prompt nodes, so connections to the Ollama server
+# are pooled and kept alive between requests instead of reopened every run.
+# The pool is sized above the executor's limit on concurrent async nodes.
+_OLLAMA_SESSION = requests.Session()
+_OLLAMA_SESSION.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Worker threads shared by all prompt nodes for running generations. Ollama
+# mostly serializes requests anyway, so a few workers are enough; more
+# generations than that simply queue.
+_GEN_POOL = ThreadPoolExecutor(
+    max_workers=max(1, int(os.environ.get('OLLAMAFLOW_GEN_WORKERS', '4'))),
+    thread_name_prefix='ollama-gen'
+)
+
+# (connect, read) timeouts: fail fast if the server isn't up, but let a
+# generation stream for as long as it takes
+_OLLAMA_TIMEOUT = (5, None)
+
+# Bytes read from the Ollama stream at a time. Ollama streams with chunked
+# transfer encoding, so reads return as soon as each chunk arrives.
+_STREAM_CHUNK_SIZE = 65536
+
+
+def _iter_ndjson_lines(response, chunk_size=_STREAM_CHUNK_SIZE, stop_event=None):
+    """
+    Yield the newline-delimited lines of a streamed response body as bytes.
+    
+    Buffers raw chunks in a bytearray and finds line breaks with find(),
+    rather than going through iter_lines(), so nothing is decoded and a
+    long partial line isn't copied again for every chunk.
+    
+    Args:
+        response: A requests response opened with stream=True
+        chunk_size: Bytes to read per chunk
+        stop_event: Optional threading.Event; when set, iteration ends
+            before the next chunk is processed
+    """
+    buf = bytearray()
+    for chunk in response.iter_content(chunk_size=chunk_size, decode_unicode=False):
+        if stop_event is not None and stop_event.is_set():
+            return
+        buf.extend(chunk)
+        start = 0
+        while True:
+            nl = buf.find(b'\n', start)
+            if nl < 0:
+                break
+            yield bytes(buf[start:nl])
+            start = nl + 1
+        if start:
+            del buf[:start]
+    if buf:
+        yield bytes(buf)
+
+
+# Completed responses keyed by a hash of the request payload, shared by all
+# prompt nodes. Values are (stored_at, raw_response, token_count).
+_RESPONSE_CACHE = OrderedDict()
+_RESPONSE_CACHE_SIZE = 256
+_RESPONSE_CACHE_LOCK = Lock()
+
+# Google RE2 bindings, used for Remove Pattern filters when installed. RE2
+# matches in linear time but lacks some backtracking-only features.
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# The subset of regex syntax that RE2 and the re module treat the same way.
+# RE2 is only used for patterns built entirely from these pieces, so the
+# optional dependency never changes filter output. Among what's left out:
+# shorthand classes and \b (ASCII-only in RE2), backreferences, lookarounds,
+# {,n} (literal text in RE2), POSIX [:classes:] and inline flags; possessive
+# quantifiers like *+ fail to compile in RE2 and fall back that way. '$' is
+# added only with MULTILINE, since without it re also matches before a final
+# newline and RE2 doesn't.
+_RE2_SAFE_PIECES = r"""
+      [^\\\[\]{}()$]                        # literals and . * + ? | ^
+    | \\[^\w\s] | \\[nrtf]                     # escaped punctuation, common escapes
+    | \((?!\?) | \(\?: | \(\?P<\w+> | \)      # plain, non-capturing and named groups
+    | \{\d+(?:,\d*)?\}                         # counted repeats with a lower bound
+    | \[\^?\]?(?:[^\\\[\]]|\\[^\w\s]|\\[nrtf])*\]  # simple character classes
+"""
+_RE2_SAFE = re.compile(f'(?:{_RE2_SAFE_PIECES})*', re.VERBOSE)
+_RE2_SAFE_MULTILINE = re.compile(f'(?:{_RE2_SAFE_PIECES} | \\$)*', re.VERBOSE)
+
+# re flags and their inline RE2 equivalents
+_RE2_INLINE_FLAGS = ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'))
+
+
+def _compile_re2(pattern, flags):
+    """
+    Compile a filter pattern with RE2 if it's installed and supports the pattern.
+    
+    Args:
+        pattern: The regex source string
+        flags: Combined re module flags (IGNORECASE, MULTILINE, DOTALL)
+        
+    Returns:
+        The RE2 pattern object, or None to fall back to the re module
+    """
+    if re2 is None:
+        return None
+    safe = _RE2_SAFE_MULTILINE if flags & re.MULTILINE else _RE2_SAFE
+    if not safe.fullmatch(pattern):
+        return None
+    
+    # Case folding of non-ASCII letters differs in a few corners
+    if flags & re.IGNORECASE and not pattern.isascii():
+        return None
+    
+    inline = ''.join(letter for flag, letter in _RE2_INLINE_FLAGS if flags & flag)
+    try:
+        return re2.compile(f'(?{inline}){pattern}' if inline else pattern)
+    except Exception:
+        return None
+
+
+# A whole filter pattern of the form <tag>.*?</tag>
+_LAZY_TAG_BLOCK = re.compile(r'<([A-Za-z][\w:-]*)>\.\*\?</\1>')
+
+# Possessive quantifiers are only available in the re module from Python 3.11
+_HAS_POSSESSIVE = sys.version_info >= (3, 11)
+
+
+def _temper_tag_pattern(pattern, flags):
+    """
+    Rewrite a lazy <tag>.*?</tag> block pattern into an equivalent
+    tempered form that scans between the tags without backtracking.
+    
+    Args:
+        pattern: The filter pattern as entered by the user
+        flags: Combined re module flags
+        
+    Returns:
+        The rewritten pattern, or the original when it doesn't apply
+    """
+    # Without DOTALL '.' stops at newlines, which the tempered form doesn't
+    if not _HAS_POSSESSIVE or not flags & re.DOTALL:
+        return pattern
+    match = _LAZY_TAG_BLOCK.fullmatch(pattern)
+    if match is None:
+        return pattern
+    tag = match.group(1)
+    return f'<{tag}>[^<]*+(?:<(?!/{tag}>)[^<]*+)*+</{tag}>'
+
+
+def _filter_text(text, filter_mode, compiled_pattern):
+    """
+    Apply a compiled filter pattern to a response.
+    
+    Args:
+        text: The response text
+        filter_mode: 'Remove Pattern' or 'Extract Pattern'; anything else leaves text as-is
+        compiled_pattern: The compiled filter regex
+    """
+    if filter_mode == 'Remove Pattern':
+        return compiled_pattern.sub('', text)
+    
+    if filter_mode == 'Extract Pattern':
+        matches = compiled_pattern.findall(text)
+        
+        # findall returns tuples only when there are several capturing
+        # groups; use the first group in that case
+        if compiled_pattern.groups > 1:
+            matches = [match[0] for match in matches]
+        return "\n".join(matches)
+    
+    return text
+
+
+# Longest response whose filtered result is memoized; hashing and holding on
+# to anything bigger isn't worth it
+_FILTER_MEMO_MAX_CHARS = 1 << 20
+
+
+@lru_cache(maxsize=16)
+def _filter_text_cached(text, filter_mode, compiled_pattern):
+    """Memoized _filter_text for responses that get filtered repeatedly"""
+    return _filter_text(text, filter_mode, compiled_pattern)
+
+
+def _response_cache_key(payload):
+    """Hash a request payload into a stable response cache key"""
+    encoded = json.dumps(payload, sort_keys=True).encode('utf-8')
+    return blake2b(encoded, digest_size=16).hexdigest()
+
+
+def _response_cache_get(key, ttl):
+    """
+    Look up a cached response, dropping it if it's older than the TTL.
+    
+    Args:
+        key: Cache key from _response_cache_key
+        ttl: Maximum age in seconds
+        
+    Returns:
+        (raw_response, token_count) or None on a miss
+    """
+    with _RESPONSE_CACHE_LOCK:
+        entry = _RESPONSE_CACHE.get(key)
+        if entry is None:
+            return None
+        stored_at, raw_response, token_count = entry
+        if time.time() - stored_at > ttl:
+            del _RESPONSE_CACHE[key]
+            return None
+        _RESPONSE_CACHE.move_to_end(key)
+        return raw_response, token_count
+
+
+def _response_cache_put(key, raw_response, token_count):
+    """Store a completed response, evicting the least recently used entry when full"""
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE[key] = (time.time(), raw_response, token_count)
+        _RESPONSE_CACHE.move_to_end(key)
+        if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_SIZE:
+            _RESPONSE_CACHE.popitem(last=False)
+
 class PromptNode(OllamaBaseNode):
     """A node that sends prompts to an LLM and outputs the response"""
     
@@ -19,6 +266,32 @@ class PromptNode(OllamaBaseNode):
     # Node category for menu organization
     NODE_CATEGORY = 'Basic'
     
+    # Sampled LLM output isn't a function of the inputs, and a run can end
+    # early; deterministic reuse goes through the response cache instead
+    _MEMOIZE = False
+    
+    # How many compiled filter patterns each node keeps around
+    _REGEX_CACHE_SIZE = 8
+    
+    # Minimum seconds between streaming preview and status updates
+    _PREVIEW_INTERVAL = 0.1
+    _STATUS_INTERVAL = 0.25
+    
+    # Characters of the raw response shown while it is still streaming (the
+    # most recent ones, so the preview follows the generation)
+    _STREAM_PREVIEW_LIMIT = 10000
+    
+    # Status line templates for streaming progress and completion
+    _STATUS_GENERATING = "Generating: %d tokens (%.1f/s)"
+    _STATUS_COMPLETE = "Complete: %d tokens (%.1f/s)"
+    
+    # Properties that make up a generate request
+    _REQUEST_PROPS = ('model', 'temperature', 'top_p', 'top_k', 'repeat_penalty', 'max_tokens')
+    
+    # Properties that determine the response filter
+    _FILTER_PROPS = ('filter_mode', 'filter_pattern', 'use_regex_flags',
+                     'dotall_flag', 'multiline_flag', 'ignorecase_flag')
+    
     # Define class-level signals for UI updates
     class PromptSignals(QObject):
         update_response = Signal(object, str)
@@ -51,6 +324,18 @@ class PromptNode(OllamaBaseNode):
         self.add_text_input('repeat_penalty', 'Repeat Penalty', '1.1')
         self.add_text_input('max_tokens', 'Max Tokens', '2048')
         
+        # How long identical requests reuse a previous response (0 disables).
+        # Only applies at temperature 0, where the output is deterministic.
+        self.exclude_property_from_input('cache_ttl')
+        self.add_text_input('cache_ttl', 'Response Cache TTL (seconds)', '3600', tab='Configuration')
+        
+        # How long Ollama keeps the model loaded after a request (e.g. '30m').
+        # Empty leaves it to the server (OLLAMA_KEEP_ALIVE, 5 minutes by default).
+        # Keeping static instructions in the system prompt lets the server reuse
+        # its prefix cache while the model stays loaded.
+        self.exclude_property_from_input('keep_alive')
+        self.add_text_input('keep_alive', 'Keep Model Loaded For', '', tab='Configuration')
+        
         # Add response filtering options
         self.add_combo_menu('filter_mode', 'Filter Mode', 
                           ['None', 'Remove Pattern', 'Extract Pattern'], 
@@ -80,11 +365,22 @@ class PromptNode(OllamaBaseNode):
         self.add_text_input('status_info', 'Status', 'Ready')
         
         # Additional prompt node state
-        self.stop_requested = False
+        self.stop_event = Event()  # Set to stop the running generation
         self.current_response = None
+        self._future = None  # Pool future for the queued or running generation
         self.response = ""
         self.token_count = 0
-        self.start_time = None
+        self.start_time = None  # time.perf_counter() when the generation started
+        self._response_chunks = []  # Pieces of the response being streamed
+        self._stream_len = 0  # Characters streamed so far
+        self._next_preview_emit = 0.0  # time.monotonic() when the next streaming preview is due
+        self._next_status_emit = 0.0  # time.monotonic() when the next streaming status is due
+        self._compiled_filter = None  # (filter_mode, compiled pattern) for the current generation
+        self._filter_settings = None  # Filter property values _filter_result was built from
+        self._filter_result = None  # (filter_mode, compiled pattern) for _filter_settings
+        self._options_key = None  # Raw sampling property values _options was parsed from
+        self._options = None  # Ollama options dict for _options_key
+        self._regex_cache = OrderedDict()  # Compiled filter patterns keyed by (pattern, flags, use_re2)
         
         # Set node color
         self.set_color(217, 86, 59)
@@ -130,58 +426,110 @@ class PromptNode(OllamaBaseNode):
         
         # Clear previous response data
         self.response = ""
+        self._response_chunks = []
         self.token_count = 0
-        self.stop_requested = False
+        self.stop_event.clear()
         
         # Start time tracking
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         self.set_status("Generating...")
         
         # Clear previous content
         self.signals.update_response.emit(self, "")
         self.signals.update_raw_response.emit(self, "")
         
-        # Start generation in a separate thread
-        Thread(target=self._generation_thread, 
-               args=(system_prompt, user_prompt), 
-               daemon=True).start()
+        # Run the generation on the shared worker pool
+        self._future = _GEN_POOL.submit(self._generation_thread, system_prompt, user_prompt)
         
         # Return a placeholder result
         return {'Response': "Processing...", 'Raw Response': "Processing..."}
     
+    @property
+    def stop_requested(self):
+        """Whether a stop has been requested (backed by stop_event)"""
+        return self.stop_event.is_set()
+    
+    @stop_requested.setter
+    def stop_requested(self, value):
+        if value:
+            self.stop_event.set()
+        else:
+            self.stop_event.clear()
+    
+    def stop_generation(self):
+        """
+        Stop this node's queued or running generation.
+        
+        A stream that's already running ends at the next chunk, or right away
+        if it's waiting on the server. The partial response is discarded and
+        the node stays dirty.
+        """
+        self.stop_event.set()
+        self._abort_stream()
+        
+        # A generation that never started won't complete the async run itself
+        if self._future is not None and self._future.cancel():
+            self.processing = False
+            self.processing_done = True
+            self.set_status("Stopped")
+    
+    def _abort_stream(self):
+        """
+        Shut down the socket of the active stream so a read blocked on a
+        stalled server returns instead of waiting forever (there is no read
+        timeout). Without this, closing the app could hang joining the worker.
+        """
+        response = self.current_response
+        if response is None:
+            return
+        
+        # requests wraps a urllib3 response that holds on to its connection
+        connection = getattr(getattr(response, 'raw', None), 'connection', None)
+        sock = getattr(connection, 'sock', None)
+        if sock is None:
+            return
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            # Already closed or disconnected
+            pass
+    
     def _generation_thread(self, system_prompt, user_prompt):
         """Thread for async generation"""
         try:
-            self.generate_response(system_prompt, user_prompt)
+            # Read the filter settings and compile the pattern once per generation
+            self._compiled_filter = self._build_filter()
             
-            # Log the raw response size for debugging
-            raw_size = len(self.response)
-            print(f"Raw response generated - {raw_size} characters")
+            from_cache = self.generate_response(system_prompt, user_prompt)
             
-            # Cache filter_mode and filter_pattern values at the time of processing
-            # This ensures they don't change while the async operation is in progress
-            filter_mode = self.get_property_value('filter_mode')
-            filter_pattern = self.get_property_value('filter_pattern')
-            print(f"Preparing to filter response with mode: {filter_mode}")
-            print(f"Using filter pattern: {filter_pattern}")
+            # A stopped generation isn't a result: leave the node dirty so the next
+            # run generates again, and keep the "Stopped" status
+            if self.stop_event.is_set():
+                self.dirty = True
+                self.processing = False
+                self.processing_done = True
+                self.signals.update_status.emit(self, "Stopped")
+                if _DEBUG:
+                    print(f"Generation stopped after {self.token_count} tokens")
+                return
             
             # Apply filtering to the response
             filtered_response = self.apply_response_filtering(self.response)
             
-            filtered_size = len(filtered_response)
-            print(f"Filtering complete - Raw: {raw_size} chars, Filtered: {filtered_size} chars")
-            
-            # Verify filtering actually did something
-            if filtered_response == self.response and filter_mode != 'None':
-                print(f"WARNING: Filtered response is identical to raw response despite filtering mode: {filter_mode}")
-                if filter_mode == 'Remove Pattern':
-                    print(f"Check if pattern '{filter_pattern}' exists in the response")
-                elif filter_mode == 'Extract Pattern':
-                    print(f"Check if pattern '{filter_pattern}' matches anything in the response")
-            
-            # Store the full output values in properties
-            self.thread_safe_set_property('raw_response', self.response)
-            self.thread_safe_set_property('response', filtered_response)
+            # Report on filtering for debugging; the settings are only read here
+            if _DEBUG:
+                filter_mode = self.get_property_value('filter_mode')
+                filter_pattern = self.get_property_value('filter_pattern')
+                print(f"Filtering complete - mode: {filter_mode}, pattern: {filter_pattern}, "
+                      f"Raw: {len(self.response)} chars, Filtered: {len(filtered_response)} chars")
+                
+                # Verify filtering actually did something (cheap mode check first)
+                if filter_mode != 'None' and filtered_response == self.response:
+                    print(f"WARNING: Filtered response is identical to raw response despite filtering mode: {filter_mode}")
+                    if filter_mode == 'Remove Pattern':
+                        print(f"Check if pattern '{filter_pattern}' exists in the response")
+                    elif filter_mode == 'Extract Pattern':
+                        print(f"Check if pattern '{filter_pattern}' matches anything in the response")
             
             # Prepare result dictionary
             result_dict = {
@@ -193,126 +541,159 @@ class PromptNode(OllamaBaseNode):
             self.async_processing_complete(result_dict)
             
             # Use signal to update status from worker thread
-            final_status = f"Complete: {self.token_count} tokens"
+            if from_cache:
+                final_status = f"Complete (cached): {self.token_count} tokens"
+            else:
+                final_status = f"Complete: {self.token_count} tokens"
             self.signals.update_status.emit(self, final_status)
             
-            # Update both raw and filtered responses with the final content
+            # Store the full output values in properties (once each, on the main thread)
             self.signals.update_raw_response.emit(self, self.response)
             self.signals.update_response.emit(self, filtered_response)
             
-            print(f"Generation thread completed with {self.token_count} tokens")
+            if _DEBUG:
+                print(f"Generation thread completed with {self.token_count} tokens")
             
         except Exception as e:
-            import traceback
             traceback.print_exc()
             
             # Use signals for thread-safe updates
-            self.signals.update_status.emit(self, f"Error: {str(e)}")
             self.processing_error = str(e)
+            self.signals.update_status.emit(self, f"Error: {self.processing_error}")
             self.processing = False
             self.processing_done = True
+        
+        finally:
+            # The filter only belongs to this generation; later calls read the
+            # settings current at that time
+            self._compiled_filter = None
     
     def apply_response_filtering(self, text):
         """Apply regex filtering to the response based on filter settings"""
-        # Get filter mode directly from property
-        filter_mode = self.get_property('filter_mode')
+        # Use the filter built for this generation, or build one from the current settings
+        filter_mode, compiled_pattern = self._compiled_filter or self._build_filter()
+        
+        # If no filtering is selected or the pattern is unusable, return the original text
+        if compiled_pattern is None:
+            return text
+            
+        try:
+            # Apply filtering based on mode, reusing the result for text that was
+            # already filtered the same way (re-runs, cached responses)
+            if len(text) <= _FILTER_MEMO_MAX_CHARS:
+                return _filter_text_cached(text, filter_mode, compiled_pattern)
+            return _filter_text(text, filter_mode, compiled_pattern)
+            
+        except Exception as e:
+            print(f"Error in response filtering: {e}")
+            traceback.print_exc()
+            return text  # Return original text on error
+    
+    def _build_filter(self):
+        """
+        Read the filter settings and compile the filter pattern.
+        
+        The result is kept until one of the filter settings changes, so the
+        flag strings are only parsed again after an edit (or a new value
+        arriving on one of their inputs).
         
-        print(f"Applying filter mode: '{filter_mode}'")
+        Returns:
+            (filter_mode, compiled_pattern), where compiled_pattern is None
+            when no filtering should be applied
+        """
+        settings = tuple(self.get_property(prop_name) for prop_name in self._FILTER_PROPS)
+        if settings != self._filter_settings:
+            self._filter_result = self._parse_filter(*settings)
+            self._filter_settings = settings
+        return self._filter_result
+    
+    def _parse_filter(self, filter_mode, pattern, use_regex_flags,
+                      dotall_flag, multiline_flag, ignorecase_flag):
+        """
+        Turn raw filter property values into a compiled filter.
         
-        # If no filtering is selected or filter mode is not recognized, return the original text
+        Args:
+            filter_mode: 'None', 'Remove Pattern' or 'Extract Pattern'
+            pattern: The regex source string
+            use_regex_flags, dotall_flag, multiline_flag, ignorecase_flag:
+                The 'true'/'false' flag property values
+                
+        Returns:
+            (filter_mode, compiled_pattern), as for _build_filter
+        """
+        # If no filtering is selected or filter mode is not recognized, don't filter
         if not filter_mode or filter_mode == 'None':
-            print("No filtering applied - returning original text")
-            return text
+            return filter_mode, None
             
         try:
-            # Get pattern
-            pattern = self.get_property('filter_pattern')
             if not pattern:
-                print("No filter pattern provided - returning original text")
-                return text
-                
-            print(f"Using filter pattern: '{pattern}'")
+                return filter_mode, None
             
             # Compile regex with flags if enabled
             flags = 0
-            use_flags = self.get_property('use_regex_flags').lower() == 'true'
+            use_flags = str(use_regex_flags).lower() == 'true'
             
             if use_flags:
-                if self.get_property('dotall_flag').lower() == 'true':
+                if str(dotall_flag).lower() == 'true':
                     flags |= re.DOTALL
-                    print("Using DOTALL flag")
-                    
-                if self.get_property('multiline_flag').lower() == 'true':
+                if str(multiline_flag).lower() == 'true':
                     flags |= re.MULTILINE
-                    print("Using MULTILINE flag")
-                    
-                if self.get_property('ignorecase_flag').lower() == 'true':
+                if str(ignorecase_flag).lower() == 'true':
                     flags |= re.IGNORECASE
-                    print("Using IGNORECASE flag")
             
-            # Compile the regex with the flags
+            # Compile the regex with the flags, reusing earlier compiles
             try:
-                compiled_pattern = re.compile(pattern, flags)
-                print(f"Pattern compiled successfully with flags: {flags}")
+                compiled_pattern = self._compile_filter(pattern, flags,
+                                                        use_re2=filter_mode == 'Remove Pattern')
             except re.error as e:
                 print(f"Error compiling regex pattern: {e}")
-                return text
-            
-            # Apply filtering based on mode
-            if filter_mode == 'Remove Pattern':
-                print("Applying 'Remove Pattern' filtering")
-                result = compiled_pattern.sub('', text)
-                print(f"Filtering removed {len(text) - len(result)} characters")
-                return result
-                
-            elif filter_mode == 'Extract Pattern':
-                print("Applying 'Extract Pattern' filtering")
-                matches = compiled_pattern.findall(text)
-                
-                if not matches:
-                    print("No matches found with pattern")
-                    return ""
-                    
-                print(f"Found {len(matches)} matches")
-                
-                # Handle tuple results from capturing groups
-                result = []
-                for match in matches:
-                    if isinstance(match, tuple):
-                        # Use the first capturing group if there are multiple
-                        result.append(match[0] if match else "")
-                    else:
-                        result.append(match)
-                        
-                joined_result = "\n".join(result)
-                print(f"Extracted {len(joined_result)} characters")
-                return joined_result
-                
-            else:
-                print(f"Unrecognized filter mode: '{filter_mode}' - returning original text")
-                return text
-                
+                return filter_mode, None
+            
+            return filter_mode, compiled_pattern
+            
         except Exception as e:
-            import traceback
-            print(f"Error in response filtering: {e}")
+            print(f"Error building response filter: {e}")
             traceback.print_exc()
-            return text  # Return original text on error
+            return filter_mode, None
+    
+    def _compile_filter(self, pattern, flags, use_re2=False):
+        """
+        Return the compiled filter pattern, compiling only on a cache miss.
+        
+        Args:
+            pattern: The regex source string
+            flags: Combined re module flags
+            use_re2: Prefer RE2 when it's installed and supports the pattern
+        """
+        key = (pattern, flags, use_re2)
+        compiled = self._regex_cache.get(key)
+        if compiled is not None:
+            self._regex_cache.move_to_end(key)
+            return compiled
+        
+        compiled = _compile_re2(pattern, flags) if use_re2 else None
+        if compiled is None:
+            compiled = re.compile(_temper_tag_pattern(pattern, flags), flags)
+        self._regex_cache[key] = compiled
+        if len(self._regex_cache) > self._REGEX_CACHE_SIZE:
+            self._regex_cache.popitem(last=False)
+        return compiled
     
     def generate_response(self, system_prompt, user_prompt):
-        """Generate a response from the LLM"""
+        """
+        Generate a response from the LLM into self.response.
+        
+        Returns:
+            True if the response came from the response cache, False otherwise
+        """
         try:
             # Prepare API call parameters using property values
-            options = {
-                "temperature": float(self.get_property_value('temperature')),
-                "top_p": float(self.get_property_value('top_p')),
-                "top_k": int(self.get_property_value('top_k')),
-                "repeat_penalty": float(self.get_property_value('repeat_penalty')),
-                "num_predict": int(self.get_property_value('max_tokens'))
-            }
+            params = self._snapshot(self._REQUEST_PROPS)
+            options = self._build_options(params)
             
             # Prepare payload
             payload = {
-                "model": self.get_property_value('model'),
+                "model": params['model'],
                 "prompt": user_prompt,
                 "stream": True,
                 "options": options
@@ -324,69 +705,186 @@ class PromptNode(OllamaBaseNode):
             
             # Reset counters and start time
             self.token_count = 0
-            self.start_time = time.time()
+            self.start_time = time.perf_counter()
+            
+            # Streamed text is collected in pieces and joined only when needed
+            self._response_chunks = []
+            self._stream_len = 0
+            self._next_preview_emit = 0.0
+            self._next_status_emit = 0.0
             
-            # Make the API call
-            self.current_response = requests.post(
+            # Deterministic requests can reuse an identical earlier response
+            cache_key = None
+            cache_ttl = self._get_cache_ttl()
+            if cache_ttl > 0 and options["temperature"] <= 0.0:
+                cache_key = _response_cache_key(payload)
+                cached = _response_cache_get(cache_key, cache_ttl)
+                if cached is not None:
+                    self.response, self.token_count = cached
+                    self._response_chunks = [self.response]
+                    return True
+            
+            # Ask Ollama to keep the model (and its cached prompt prefix) loaded
+            # between runs, only if the user set a duration. Added after the
+            # cache lookup since it doesn't affect output.
+            keep_alive = str(self.get_property('keep_alive') or '').strip()
+            if keep_alive:
+                payload["keep_alive"] = keep_alive
+            
+            # Make the API call with the payload encoded up front
+            self.current_response = _OLLAMA_SESSION.post(
                 "http://localhost:11434/api/generate",
-                json=payload,
-                stream=True
+                data=_json_dumps(payload),
+                headers=_JSON_HEADERS,
+                stream=True,
+                timeout=_OLLAMA_TIMEOUT
             )
             
             if self.current_response.status_code != 200:
                 self.signals.update_status.emit(self, f"API Error: {self.current_response.status_code}")
                 print(f"Error from Ollama API: {self.current_response.text}")
-                return
+                return False
             
-            # Process the streaming response
-            for line in self.current_response.iter_lines():
-                if self.stop_requested:
-                    print("Generation stopped by user")
-                    break
-                
+            # Look up what the per-token path uses once, outside the loop
+            append_chunk = self._response_chunks.append
+            monotonic = time.monotonic
+            emit_status = self.signals.update_status.emit
+            emit_raw_response = self.signals.update_raw_response.emit
+            
+            # Process the streaming response; a stop is checked once per chunk
+            for line in _iter_ndjson_lines(self.current_response, stop_event=self.stop_event):
                 if line:
                     try:
-                        data = json.loads(line)
+                        data = _json_loads(line)
                         if 'response' in data:
                             response_text = data['response']
-                            self.response += response_text
+                            append_chunk(response_text)
+                            self._stream_len += len(response_text)
                             self.token_count += 1
                             
-                            # Update status every few tokens using signal
-                            if self.token_count % 5 == 0:
-                                elapsed = time.time() - self.start_time
+                            # Update the preview and status at most once per interval
+                            # each, however fast tokens arrive
+                            now = monotonic()
+                            if now >= self._next_status_emit:
+                                self._next_status_emit = now + self._STATUS_INTERVAL
+                                elapsed = time.perf_counter() - self.start_time
                                 tps = self.token_count / elapsed if elapsed > 0 else 0
-                                status_text = f"Generating: {self.token_count} tokens ({tps:.1f}/s)"
-                                self.signals.update_status.emit(self, status_text)
-                                
-                                # Only update the raw response during streaming
-                                if self.token_count % 10 == 0:
-                                    self.signals.update_raw_response.emit(self, self.response)
+                                status_text = self._STATUS_GENERATING % (self.token_count, tps)
+                                emit_status(self, status_text)
+                            
+                            # Only preview the raw response during streaming; the
+                            # full text is sent once the stream is done
+                            if now >= self._next_preview_emit:
+                                self._next_preview_emit = now + self._PREVIEW_INTERVAL
+                                emit_raw_response(self, self._stream_preview())
                         
                         # Check for completion
                         if data.get('done', False):
-                            elapsed = time.time() - self.start_time
+                            self._materialize_response()
+                            
+                            # Only complete, uninterrupted responses are worth reusing
+                            if cache_key is not None:
+                                _response_cache_put(cache_key, self.response, self.token_count)
+                            
+                            elapsed = time.perf_counter() - self.start_time
                             tps = self.token_count / elapsed if elapsed > 0 else 0
-                            status_text = f"Complete: {self.token_count} tokens ({tps:.1f}/s)"
+                            status_text = self._STATUS_COMPLETE % (self.token_count, tps)
                             self.signals.update_status.emit(self, status_text)
                             
-                            # Final update for raw response
-                            self.signals.update_raw_response.emit(self, self.response)
-                            
-                            print(f"Generation complete: {self.token_count} tokens in {elapsed:.2f}s ({tps:.1f}/s)")
+                            if _DEBUG:
+                                print(f"Generation complete: {self.token_count} tokens in {elapsed:.2f}s ({tps:.1f}/s)")
                     
-                    except json.JSONDecodeError:
+                    except ValueError:
+                        # Both json and orjson decode errors are ValueErrors
                         print(f"Error decoding JSON from Ollama API: {line}")
                         self.signals.update_status.emit(self, "Error: JSON decode failed")
             
+            if _DEBUG and self.stop_event.is_set():
+                print("Generation stopped by user")
+            
         except Exception as e:
-            print(f"Exception in generate_response: {str(e)}")
-            import traceback
+            # A stop shuts the stream down under the read, which surfaces here
+            if self.stop_event.is_set():
+                self.signals.update_status.emit(self, "Stopped")
+                return False
+            
+            error_text = str(e)
+            print(f"Exception in generate_response: {error_text}")
             traceback.print_exc()
-            self.signals.update_status.emit(self, f"Error: {str(e)[:20]}...")
+            self.signals.update_status.emit(self, f"Error: {error_text[:20]}...")
         
         finally:
+            # Leave the complete text in self.response however the stream ended
+            self._materialize_response()
+            
+            # Release the connection back to the pool, even if the stream was cut short
+            if self.current_response is not None:
+                self.current_response.close()
             self.current_response = None
+        
+        return False
+    
+    def _build_options(self, params):
+        """
+        Parse the sampling properties into Ollama request options.
+        
+        The parsed options are reused until one of the raw values changes.
+        
+        Args:
+            params: Property snapshot holding the _REQUEST_PROPS values
+            
+        Returns:
+            The options dict for the request payload
+        """
+        key = (params['temperature'], params['top_p'], params['top_k'],
+               params['repeat_penalty'], params['max_tokens'])
+        if key != self._options_key:
+            self._options = {
+                "temperature": float(params['temperature']),
+                "top_p": float(params['top_p']),
+                "top_k": int(params['top_k']),
+                "repeat_penalty": float(params['repeat_penalty']),
+                "num_predict": int(params['max_tokens'])
+            }
+            self._options_key = key
+        return self._options
+    
+    def _materialize_response(self):
+        """
+        Join the streamed chunks into self.response and return it.
+        
+        self.response is a snapshot that only catches up with the stream
+        when this is called (on completion and when the stream ends).
+        """
+        self.response = "".join(self._response_chunks)
+        return self.response
+    
+    def _stream_preview(self):
+        """
+        Build the raw response preview from the tail of the stream.
+        
+        Only the last chunks covering _STREAM_PREVIEW_LIMIT characters are
+        joined, so the cost doesn't grow with the length of the response.
+        """
+        limit = self._STREAM_PREVIEW_LIMIT
+        if self._stream_len <= limit:
+            return "".join(self._response_chunks)
+        
+        # Walk back from the newest chunk until the limit is covered
+        chunks = self._response_chunks
+        start = len(chunks)
+        covered = 0
+        while start > 0 and covered < limit:
+            start -= 1
+            covered += len(chunks[start])
+        return '...' + "".join(chunks[start:])[-limit:]
+    
+    def _get_cache_ttl(self):
+        """Read the response cache TTL in seconds, treating invalid values as disabled"""
+        try:
+            return float(self.get_property('cache_ttl'))
+        except (TypeError, ValueError):
+            return 0.0
     
     def deserialize(self, node_dict, namespace=None, context=None):
         """Called when the node is being deserialized from a saved workflow"""
@@ -1,6 +1,16 @@
 import re
+import traceback
+from collections import OrderedDict
+from functools import lru_cache
 from nodes.base_node import OllamaBaseNode
 
+
+@lru_cache(maxsize=64)
+def _is_literal(pattern_text):
+    """Check whether a pattern has no regex metacharacters (matches itself literally)"""
+    return bool(pattern_text) and re.escape(pattern_text) == pattern_text
+
+
 class RegexNode(OllamaBaseNode):
     """A node that applies a regex pattern to its input text"""
     
@@ -14,7 +24,13 @@ class RegexNode(OllamaBaseNode):
     # Node category for menu organization
     NODE_CATEGORY = 'Basic'
     
+    # How many compiled patterns each node keeps around
+    _REGEX_CACHE_SIZE = 8
+    
     def __init__(self):
+        # Compiled patterns keyed by (pattern, flags)
+        self._regex_cache = OrderedDict()
+        
         super(RegexNode, self).__init__()
         
         # Set node name that will be displayed
@@ -56,8 +72,7 @@ class RegexNode(OllamaBaseNode):
         
         # Update input preview
         if input_text:
-            preview = input_text[:5000] + ('...' if len(input_text) > 5000 else '')
-            self.set_property('input_preview', preview)
+            self.set_property('input_preview', self.make_preview(input_text))
         
         if not input_text:
             self.set_status("No input text")
@@ -75,20 +90,36 @@ class RegexNode(OllamaBaseNode):
             if self.get_property_value('use_ignorecase').lower() == 'true':
                 flags |= re.IGNORECASE
             
-            # Compile the regex pattern
-            pattern = re.compile(self.get_property_value('pattern'), flags)
+            # Compile the regex pattern, reusing the last compile when unchanged
+            pattern_text = self.get_property_value('pattern')
+            pattern = self._compile_pattern(pattern_text, flags)
+            
+            # Plain-text patterns can use str methods, which skip the regex engine
+            literal = _is_literal(pattern_text) and not flags & re.IGNORECASE
             
             # Perform the selected operation
             operation = self.get_property_value('operation').lower()
             replacement = self.get_property_value('replacement')
             
             if operation == 'replace':
-                result = pattern.sub(replacement, input_text)
+                # Backslashes in the replacement are escapes for re.sub, so keep those on the regex path
+                if literal and '\\' not in replacement:
+                    result = input_text.replace(pattern_text, replacement)
+                else:
+                    result = pattern.sub(replacement, input_text)
             elif operation == 'match':
-                match = pattern.search(input_text)
-                result = match.group(0) if match else ""
+                if literal:
+                    result = pattern_text if pattern_text in input_text else ""
+                else:
+                    match = pattern.search(input_text)
+                    result = match.group(0) if match else ""
             elif operation == 'split':
-                result = "\n".join(pattern.split(input_text))
+                if literal:
+                    result = "\n".join(input_text.split(pattern_text))
+                else:
+                    result = "\n".join(pattern.split(input_text))
+            elif operation == 'findall' and literal:
+                result = "\n".join([pattern_text] * input_text.count(pattern_text))
             elif operation == 'findall':
                 matches = pattern.findall(input_text)
                 # Handle tuple results from capturing groups
@@ -104,15 +135,34 @@ class RegexNode(OllamaBaseNode):
                 
             # Update result preview
             if result:
-                preview = result[:5000] + ('...' if len(result) > 5000 else '')
-                self.set_property('result_preview', preview)
+                self.set_property('result_preview', self.make_preview(result))
                 
             self.set_status("Complete")
             return {"Result": result}
             
         except Exception as e:
-            import traceback
             traceback.print_exc()
-            self.set_status(f"Error: {str(e)[:20]}...")
-            self.set_property('result_preview', f"Error: {str(e)}")
-            return {"Result": ""}
\ No newline at end of file
+            error_text = str(e)
+            self.set_status(f"Error: {error_text[:20]}...")
+            self.set_property('result_preview', f"Error: {error_text}")
+            return {"Result": ""}
+    
+    def _compile_pattern(self, pattern_text, flags):
+        """
+        Return a compiled pattern, compiling only on a cache miss.
+        
+        Args:
+            pattern_text: The regex source string
+            flags: Combined re module flags
+        """
+        key = (pattern_text, flags)
+        pattern = self._regex_cache.get(key)
+        if pattern is not None:
+            self._regex_cache.move_to_end(key)
+            return pattern
+        
+        pattern = re.compile(pattern_text, flags)
+        self._regex_cache[key] = pattern
+        if len(self._regex_cache) > self._REGEX_CACHE_SIZE:
+            self._regex_cache.popitem(last=False)
+        return pattern
@@ -20,8 +20,7 @@ class StaticTextNode(OllamaBaseNode):
         # Set node name that will be displayed
         self.set_name('Static Text')
         
-        # Initialize these properties first to avoid errors
-        self._excluded_input_props = set()
+        # Exclude the status display from auto-input creation
         self.exclude_property_from_input('status_info')
         
         # Create property for text content - this will automatically create an input
@@ -9,6 +9,10 @@ setup(
         "NodeGraphQt>=0.6.2",
         "requests>=2.25.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.0"],
+        "re2": ["google-re2>=1.0"],
+    },
     entry_points={
         'console_scripts': [
             'ollamaflow=app:main',
@@ -1,4 +1,5 @@
 import time
+import traceback
 from threading import Thread, Event
 from PySide6.QtCore import QObject, Signal, Qt, Slot, QCoreApplication, QThread
 
@@ -26,6 +27,15 @@ def get_executor_signals():
 class WorkflowExecutor:
     """Handles the execution of a NodeGraphQt workflow"""
     
+    # Asynchronous nodes (e.g. LLM prompts) allowed to run at the same time
+    MAX_CONCURRENT_ASYNC = 8
+    
+    # Seconds before giving up on an asynchronous node (1 hour)
+    ASYNC_TIMEOUT = 3600
+    
+    # Seconds between checks on running asynchronous nodes
+    ASYNC_POLL_INTERVAL = 0.1
+    
     def __init__(self, graph):
         self.graph = graph
         self.execution_thread = None
@@ -34,6 +44,9 @@ class WorkflowExecutor:
         
         # Store the callback for later use
         self.callback = None
+        
+        # Whether the completion signal is already wired to this executor
+        self._completion_connected = False
     
     def execute_workflow(self, callback=None):
         """Execute the entire workflow with a callback when done"""
@@ -49,13 +62,15 @@ class WorkflowExecutor:
         
         # Connect the signal if not already connected
         signal_handler = get_executor_signals()
-        if callback and signal_handler:
-            # We don't have a way to check if already connected in PySide6, 
-            # so we'll just connect (Qt handles duplicate connections safely)
+        if callback and signal_handler and not self._completion_connected:
+            # Qt only de-duplicates connections to QObject slots, and this
+            # executor isn't a QObject - so track the connection ourselves,
+            # otherwise every run would add another callback invocation
             signal_handler.execution_completed.connect(
                 self._handle_completion_on_main_thread, 
                 Qt.QueuedConnection
             )
+            self._completion_connected = True
         
         # Create and start the execution thread
         self.execution_thread = Thread(target=self._execute_workflow_thread, daemon=True)
@@ -71,7 +86,6 @@ class WorkflowExecutor:
                 self.callback(result)
             except Exception as e:
                 print(f"Error in workflow completion callback: {e}")
-                import traceback
                 traceback.print_exc()
     
     def _execute_workflow_thread(self):
@@ -217,6 +231,11 @@ class WorkflowExecutor:
             # Now process nodes in order (ancestors first)
             processed_count = 0
             
+            # Asynchronous nodes that are still running, mapped to their start time.
+            # Independent async nodes (e.g. sibling prompts) run side by side; a node
+            # only waits for the running ancestors it actually reads from.
+            in_flight = {}
+            
             for node in processing_queue:
                 try:
                     node_name = node.name() if hasattr(node, 'name') and callable(getattr(node, 'name')) else "Unknown"
@@ -226,6 +245,17 @@ class WorkflowExecutor:
                         print(f"Skipping node that's already processing: {node_name}")
                         continue
                     
+                    # Wait for any asynchronous inputs that haven't finished yet
+                    running_ancestors = [anc for anc in ancestors[node] if anc in in_flight]
+                    if running_ancestors:
+                        print(f"Node {node_name} waiting for {len(running_ancestors)} running dependencies...")
+                        self._wait_for_async_nodes(in_flight, running_ancestors)
+                    
+                    # Keep the number of concurrent async nodes bounded
+                    is_async = hasattr(node, 'is_async_node') and node.is_async_node
+                    if is_async:
+                        self._wait_for_async_nodes(in_flight, list(in_flight), self.MAX_CONCURRENT_ASYNC - 1)
+                    
                     print(f"Processing node: {node_name}")
                     
                     # Call compute with flag to indicate we're calling from workflow executor
@@ -234,29 +264,21 @@ class WorkflowExecutor:
                     processed_count += 1
                     node_processed = True
                     
-                    # Wait for this node to complete if it's asynchronous
-                    if hasattr(node, 'is_async_node') and node.is_async_node:
-                        print(f"Node {node_name} is asynchronous, waiting for completion...")
-                        
-                        # Wait for the node to complete (up to timeout)
-                        max_wait = 3600  # 1 hour timeout (3600 seconds)
-                        start_time = time.time()
-                        
-                        while hasattr(node, 'processing') and node.processing and time.time() - start_time < max_wait:
-                            print(f"Waiting for async node {node_name} to complete...")
-                            time.sleep(1)  # Check every second
-                        
-                        if hasattr(node, 'processing') and node.processing:
-                            print(f"Timeout waiting for async node {node_name} to complete")
-                        else:
-                            print(f"Async node {node_name} completed")
+                    # Let asynchronous nodes run in the background and move on
+                    if is_async and hasattr(node, 'processing') and node.processing:
+                        print(f"Node {node_name} is asynchronous, continuing while it runs...")
+                        in_flight[node] = time.time()
                 except Exception as e:
-                    import traceback
                     traceback.print_exc()
                     node_name = node.name() if hasattr(node, 'name') and callable(getattr(node, 'name')) else "Unknown"
                     result = (False, f"Error executing node {node_name}: {str(e)}")
                     break
             
+            # Let every asynchronous node that was started finish before reporting
+            if in_flight:
+                print(f"Waiting for {len(in_flight)} asynchronous nodes to complete...")
+                self._wait_for_async_nodes(in_flight, list(in_flight))
+            
             # Check if any async nodes are still processing
             processing_nodes = self._get_processing_nodes()
             
@@ -272,7 +294,6 @@ class WorkflowExecutor:
                 result = (True, f"Workflow executed successfully ({processed_count} nodes processed)")
         
         except Exception as e:
-            import traceback
             traceback.print_exc()
             result = (False, f"Error executing workflow: {str(e)}")
         
@@ -296,6 +317,31 @@ class WorkflowExecutor:
                     except Exception as e:
                         print(f"Error in callback: {e}")
     
+    def _wait_for_async_nodes(self, in_flight, nodes, max_running=0):
+        """
+        Block until at most max_running of the given asynchronous nodes are still running.
+        Finished or timed-out nodes are removed from in_flight as they are noticed.
+        
+        Args:
+            in_flight: Dictionary mapping running async nodes to their start time
+            nodes: The nodes to wait on
+            max_running: How many of them may keep running when this returns
+        """
+        while True:
+            now = time.time()
+            for node in list(in_flight):
+                node_name = node.name() if hasattr(node, 'name') and callable(getattr(node, 'name')) else "Unknown"
+                if not (hasattr(node, 'processing') and node.processing):
+                    print(f"Async node {node_name} completed")
+                    del in_flight[node]
+                elif now - in_flight[node] >= self.ASYNC_TIMEOUT:
+                    print(f"Timeout waiting for async node {node_name} to complete")
+                    del in_flight[node]
+            
+            if sum(1 for node in nodes if node in in_flight) <= max_running:
+                return
+            time.sleep(self.ASYNC_POLL_INTERVAL)
+    
     def _topological_sort(self, nodes_to_process, ancestors):
         """
         Perform a topological sort on the nodes to process.